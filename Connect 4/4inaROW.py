@@ -2,192 +2,416 @@ import sys
 import pygame
 import time
 import random
+import threading
+import queue
+
+def _build_winning_lines(rows_number, columns_number):
+    """Build the (row, col) coordinate tuples of every 4-in-a-row line.
+
+    Like the window masks, the lines only depend on the board size, so they
+    are computed once per (rows, columns) pair and shared by the game classes.
+
+    Args:
+        rows_number (int): The number of rows in the game board.
+        columns_number (int): The number of columns in the game board.
+
+    Returns:
+        lines (tuple): A tuple of 4-tuples of (row, col) cell coordinates.
+    """
+    cached = _WINNING_LINES_CACHE.get((rows_number, columns_number))
+    if cached is not None:
+        return cached
+    lines = []
+    # Build the lines on the rows
+    for row in range(rows_number):
+        for col in range(columns_number - 3):
+            lines.append(tuple((row, col + i) for i in range(4)))
+    # Build the lines on the columns
+    for row in range(rows_number - 3):
+        for col in range(columns_number):
+            lines.append(tuple((row + i, col) for i in range(4)))
+    # Build the lines on the first diagonals
+    for row in range(rows_number - 3):
+        for col in range(columns_number - 3):
+            lines.append(tuple((row + i, col + i) for i in range(4)))
+    # Build the lines on the second diagonals
+    for row in range(3, rows_number):
+        for col in range(columns_number - 3):
+            lines.append(tuple((row - i, col + i) for i in range(4)))
+    lines = tuple(lines)
+    _WINNING_LINES_CACHE[(rows_number, columns_number)] = lines
+    return lines
+
+_WINNING_LINES_CACHE = {}
+
+def _build_winner_scan(rows_number, columns_number):
+    """Generate an unrolled winner-scan function for the given board size.
+
+    The generic scan loops over the winning lines and unpacks four
+    coordinate pairs per line on every call. Since the lines are fixed at
+    init time, the scan is instead generated once as straight-line code
+    with the flat bytearray indices hard-coded - no loop, no unpacking,
+    no bounds checks - and shared by the game classes through a per-size
+    cache.
+
+    Args:
+        rows_number (int): The number of rows in the game board.
+        columns_number (int): The number of columns in the game board.
+
+    Returns:
+        (function): A function taking the flat state bytearray and returning
+            the winning player followed by the winning positions, or None.
+    """
+    cached = _WINNER_SCAN_CACHE.get((rows_number, columns_number))
+    if cached is not None:
+        return cached
+    empty = ord('.')
+    source = ["def winner_scan(state):"]
+    for line in _build_winning_lines(rows_number, columns_number):
+        (row0, col0), (row1, col1), (row2, col2), (row3, col3) = line
+        cells = [f"state[{row * columns_number + col}]" for row, col in line]
+        source.append(f"    if {cells[0]} != {empty} and {cells[0]} == {cells[1]} == {cells[2]} == {cells[3]}:")
+        source.append(f"        return [chr({cells[0]}), ({row0}, {col0}), ({row1}, {col1}), ({row2}, {col2}), ({row3}, {col3})]")
+    source.append("    return None")
+    namespace = {}
+    exec("\n".join(source), namespace)
+    winner_scan = namespace["winner_scan"]
+    _WINNER_SCAN_CACHE[(rows_number, columns_number)] = winner_scan
+    return winner_scan
+
+_WINNER_SCAN_CACHE = {}
 
 class MINIMAX_ALGORITHM:
+    # Flags for the transposition table entries.
+    TT_EXACT = 0
+    TT_LOWER = 1
+    TT_UPPER = 2
+    TT_MAX_SIZE = 200000
+
     def __init__(self, depth):
         """Initialize the MINIMAX_ALGORITHM object with a specified depth"""
         self.depth = depth
+        self.tt = {}
+        self.best_root_move = None
+        self._tt_age = 0
+        self._board_size = None
+        self._col_order = None
+        self._win_shifts = None
+        self._board_mask = None
+        self._zobrist = None
+
+    def prepare_board(self, rows_number, columns_number):
+        """Precompute the data that depends only on the board size.
+
+        The search keeps one bit per cell and per player, where the bit of the
+        cell (row, col) is `col * (rows_number + 1) + row` with row 0 at the
+        bottom.  The extra sentinel row per column keeps the shift based win
+        detection from wrapping between neighbour columns.
+
+        Args:
+            rows_number (int): The number of rows in the game board.
+            columns_number (int): The number of columns in the game board.
+        """
+        if self._board_size == (rows_number, columns_number):
+            return
+        self._board_size = (rows_number, columns_number)
+        self._cells_number = rows_number * columns_number
+        # Center columns cause the earliest alpha-beta cutoffs, so try them first.
+        self._col_order = sorted(range(columns_number), key=lambda col: abs(col - columns_number // 2))
+        # Shift amounts for the four winning directions: vertical, horizontal,
+        # first diagonal and second diagonal.
+        self._win_shifts = (1, rows_number + 1, rows_number, rows_number + 2)
+        # Mask with one bit set for every real (non-sentinel) cell.
+        self._board_mask = 0
+        for col in range(columns_number):
+            self._board_mask |= ((1 << rows_number) - 1) << (col * (rows_number + 1))
+        # One 64-bit random per player and per bit index, used for the
+        # incremental Zobrist hash of the transposition table.
+        bits_number = columns_number * (rows_number + 1)
+        self._zobrist = ([random.getrandbits(64) for _ in range(bits_number)],
+                         [random.getrandbits(64) for _ in range(bits_number)])
+        self.tt = {}
+
+    def state_to_bitboards(self, state):
+        """Convert the list based game state into the bitboard representation.
+
+        Args:
+            state (list): The current state of the game.
+
+        Returns:
+            bb_o (int): The bitboard of the 'O' player.
+            bb_x (int): The bitboard of the 'X' player.
+            heights (list): The next free bit-row for every column.
+        """
+        rows_number = len(state)
+        columns_number = len(state[0])
+        column_stride = rows_number + 1
+        bb_o = 0
+        bb_x = 0
+        heights = [0] * columns_number
+        for row, row_cells in enumerate(state):
+            bit_row = rows_number - 1 - row
+            for col, cell in enumerate(row_cells):
+                if cell != '.':
+                    bit = 1 << (col * column_stride + bit_row)
+                    if cell == 'O':
+                        bb_o |= bit
+                    else:
+                        bb_x |= bit
+                    heights[col] += 1
+        return bb_o, bb_x, heights
+
+    def compute_hash(self, bb_o, bb_x):
+        """Compute the Zobrist hash of a position from scratch.
+
+        Args:
+            bb_o (int): The bitboard of the 'O' player.
+            bb_x (int): The bitboard of the 'X' player.
 
-    def is_terminal(self, state):
-        """Check if the current state of the game is terminal.
+        Returns:
+            position_hash (int): The Zobrist hash of the position.
+        """
+        position_hash = 0
+        for player, bitboard in enumerate((bb_o, bb_x)):
+            randoms = self._zobrist[player]
+            while bitboard:
+                bit = bitboard & -bitboard
+                position_hash ^= randoms[bit.bit_length() - 1]
+                bitboard ^= bit
+        return position_hash
+
+    def tt_store(self, position_hash, depth, flag, value, best_move):
+        """Store a search result in the transposition table.
 
         Args:
-            True (bool): If the current state is terminal.
-            False (bool): If the current state is not terminal.
+            position_hash (int): The Zobrist hash of the position.
+            depth (int): The remaining search depth the value was computed with.
+            flag (int): TT_EXACT, TT_LOWER or TT_UPPER.
+            value (int): The value of the position.
+            best_move (int): The best move found at the position, used to order
+                moves when the position is searched again.
         """
-        if self.is_winner(state, 'O') or self.is_winner(state, 'X'):
-            return True
-        return all(cell != '.' for row in state for cell in row)
+        if len(self.tt) >= self.TT_MAX_SIZE:
+            # Age based eviction: keep only the entries of the current search.
+            self.tt = {key: entry for key, entry in self.tt.items() if entry[4] == self._tt_age}
+        self.tt[position_hash] = (depth, flag, value, best_move, self._tt_age)
 
-    def is_winner(self, state, player):
-        """Check if the specified player has won in the given game state.
+    def is_winner(self, bitboard):
+        """Check if the given bitboard contains four pieces in a row.
 
         Args:
-            state (list): The current state of the game.
-            player (str): The player to check for a winning sequence ('X' or 'O').
+            bitboard (int): The bitboard of the player to check.
 
         Returns:
             True (bool): If the player has won.
             False (bool): If the player has not won.
         """
-        # Verify if is the winner on the rows
-        for row in state:
-            for col in range(len(row) - 3):
-                if all(cell == player for cell in row[col:col + 4]):
-                    return True
-        # Verify if is the winner on the columns
-        for col in range(len(state[0])):
-            for row in range(len(state) - 3):
-                if all(state[row + i][col] == player for i in range(4)):
-                    return True
-        # Verify if is the winner on the first diagonals
-        for row in range(len(state) - 3):
-            for col in range(len(state[0]) - 3):
-                if all(state[row + i][col + i] == player for i in range(4)):
-                    return True
-        # Verify if is the winner on the second diagonals
-        for row in range(len(state) - 3):
-            for col in range(3, len(state[0])):
-                if all(state[row + i][col - i] == player for i in range(4)):
-                    return True
+        for shift in self._win_shifts:
+            pairs = bitboard & (bitboard >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
         return False
 
-    def get_possible_moves(self, state):
+    def get_possible_moves(self, heights):
         """Get a list of possible moves in the current game state.
 
         Args:
-            state (list): The current state of the game.
+            heights (list): The next free bit-row for every column.
 
         Returns:
             possible_moves (list): A list of column indices representing the possible moves.
         """
+        rows_number = self._board_size[0]
         possible_moves = []
-        for col in range(0,len(state[0])):
-            if state[0][col] == '.':
+        for col in self._col_order:
+            if heights[col] < rows_number:
                 possible_moves.append(col)
         return possible_moves
 
-    def make_move(self, state, move, player):
-        """Make a move in the current game state.
-
-        Args:
-            state (list): The current state of the game.
-            move (int): The column index where the move will be made.
-            player (str): The player making the move ('X' or 'O').
-
-        Returns:
-            new_state (list): The new state of the game after making the move.
-        """
-        col = move
-        new_state = [row[:] for row in state]
-        for r in range(len(new_state) - 1, -1, -1):
-            if new_state[r][col] == '.':
-                new_state[r][col] = player
-                break
-        return new_state
-
-    def evaluate(self, state):
+    def evaluate(self, bb_o, bb_x):
         """Evaluate the score of the given game state.
 
+        The score is computed branchlessly per direction: shift-and-AND
+        chains mark every run of 2, 3 or 4 pieces in parallel and a popcount
+        tallies them, so the cost is constant instead of one loop iteration
+        per 4-cell window. Runs of 4 score 100, runs of 3 with room to grow
+        score 5 and runs of 2 score 2, positive for 'O' and negative for 'X'.
+
         Args:
-            state (list): The current state of the game.
+            bb_o (int): The bitboard of the 'O' player.
+            bb_x (int): The bitboard of the 'X' player.
 
         Returns:
             score (int): The score of the game state.
         """
+        empty = self._board_mask & ~(bb_o | bb_x)
         score = 0
-        # Compute the score on the rows
-        for row in state:
-            for col in range(len(row) - 3):
-                window = row[col:col + 4]
-                score += self.evaluate_window(window)
-        # Compute the score on the columns
-        for col in range(len(state[0])):
-            for row in range(len(state) - 3):
-                window = [state[row + i][col] for i in range(4)]
-                score += self.evaluate_window(window)
-        # Compute the score on the first diagonals
-        for row in range(len(state) - 3):
-            for col in range(len(state[0]) - 3):
-                window = [state[row + i][col + i] for i in range(4)]
-                score += self.evaluate_window(window)
-        # Compute the score on the second diagonals
-        for row in range(len(state) - 3):
-            for col in range(3, len(state[0])):
-                window = [state[row + i][col - i] for i in range(4)]
-                score += self.evaluate_window(window)
+        for shift in self._win_shifts:
+            for bitboard, sign in ((bb_o, 1), (bb_x, -1)):
+                pairs = bitboard & (bitboard >> shift)
+                threes = pairs & (bitboard >> (2 * shift))
+                fours = threes & (bitboard >> (3 * shift))
+                # A run of 3 only matters if an empty cell borders it.
+                live_threes = threes & ((empty >> (3 * shift)) | (empty << shift))
+                score += sign * (100 * fours.bit_count()
+                                 + 5 * live_threes.bit_count()
+                                 + 2 * pairs.bit_count())
         return score
 
-    def evaluate_window(self, window):
-        """Evaluate the score of a window (subsequence) in the game state.
-
-        Args:
-            window (list): A window of the game state.
-
-        Returns:
-            int: The score of the window.
-        """
-        if window.count('O') == 4:
-            return 100
-        elif window.count('X') == 4:
-            return -100
-        elif window.count('O') == 3 and window.count('.') == 1:
-            return 5
-        elif window.count('O') == 2 and window.count('.') == 2:
-            return 2
-        elif window.count('X') == 3 and window.count('.') == 1:
-            return -5
-        elif window.count('X') == 2 and window.count('.') == 2:
-            return -2
-        else:
-            return 0
-
-    def minimax(self, state, depth, maximizing_player):
-        """Minimax algorithm for evaluating the game state.
+    def minimax(self, bb_o, bb_x, heights, position_hash, depth, alpha, beta, maximizing_player):
+        """Minimax algorithm with alpha-beta pruning for evaluating the game state.
 
         Args:
-            state (list): The current game state.
+            bb_o (int): The bitboard of the 'O' player.
+            bb_x (int): The bitboard of the 'X' player.
+            heights (list): The next free bit-row for every column.
+            position_hash (int): The Zobrist hash of the position.
             depth (int): The depth of the minimax search.
+            alpha (float): The best score already guaranteed for the maximizing player.
+            beta (float): The best score already guaranteed for the minimizing player.
             maximizing_player (bool): True if the current player is maximizing, False otherwise.
 
         Returns:
             max_eval (int): The max evaluation score for the current state.
             min_eval (int): The min evaluation score for the current state.
         """
-        if depth == 0 or self.is_terminal(state):
-            return self.evaluate(state)
+        entry = self.tt.get(position_hash)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[3]
+            if entry[0] >= depth:
+                flag = entry[1]
+                value = entry[2]
+                if flag == self.TT_EXACT:
+                    return value
+                elif flag == self.TT_LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+        # Terminal detection stays on the cheap side: two shift-and-AND win
+        # tests and a piece count, so the full evaluation only runs on the
+        # nodes that actually return a score.
+        if depth == 0 or self.is_winner(bb_o) or self.is_winner(bb_x) or sum(heights) == self._cells_number:
+            return self.evaluate(bb_o, bb_x)
+        alpha_original = alpha
+        beta_original = beta
+        # Bind the hot attributes to locals and generate the moves inline:
+        # the recursion visits thousands of nodes per search and every saved
+        # attribute lookup or intermediate list counts.
+        rows_number = self._board_size[0]
+        col_order = self._col_order
+        minimax = self.minimax
+        # A move remembered from a previous visit of this position is the
+        # most promising one, so try it before the static center-first order.
+        if tt_move is None:
+            move_order = col_order
+        else:
+            move_order = [tt_move]
+            for col in col_order:
+                if col != tt_move:
+                    move_order.append(col)
+        best_move = None
         if maximizing_player:
-            max_eval = float('-inf')
-            for move in self.get_possible_moves(state):
-                child_state = self.make_move(state, move, 'O')
-                eval = self.minimax(child_state, depth - 1, False)
-                max_eval = max(max_eval, eval)
-            return max_eval
+            randoms = self._zobrist[0]
+            best_eval = float('-inf')
+            for move in move_order:
+                height = heights[move]
+                if height >= rows_number:
+                    continue
+                # Make the move in place, recurse, then undo it: the bitboard
+                # itself needs no undo because ints are passed by value.
+                position = move * (rows_number + 1) + height
+                heights[move] = height + 1
+                eval = minimax(bb_o | (1 << position), bb_x, heights, position_hash ^ randoms[position],
+                               depth - 1, alpha, beta, False)
+                heights[move] = height
+                if eval > best_eval:
+                    best_eval = eval
+                    best_move = move
+                alpha = max(alpha, best_eval)
+                if alpha >= beta:
+                    break
+        else:
+            randoms = self._zobrist[1]
+            best_eval = float('inf')
+            for move in move_order:
+                height = heights[move]
+                if height >= rows_number:
+                    continue
+                position = move * (rows_number + 1) + height
+                heights[move] = height + 1
+                eval = minimax(bb_o, bb_x | (1 << position), heights, position_hash ^ randoms[position],
+                               depth - 1, alpha, beta, True)
+                heights[move] = height
+                if eval < best_eval:
+                    best_eval = eval
+                    best_move = move
+                beta = min(beta, best_eval)
+                if alpha >= beta:
+                    break
+        if best_eval <= alpha_original:
+            self.tt_store(position_hash, depth, self.TT_UPPER, best_eval, best_move)
+        elif best_eval >= beta_original:
+            self.tt_store(position_hash, depth, self.TT_LOWER, best_eval, best_move)
         else:
-            min_eval = float('inf')
-            for move in self.get_possible_moves(state):
-                child_state = self.make_move(state, move, 'X')
-                eval = self.minimax(child_state, depth - 1, True)
-                min_eval = min(min_eval, eval)
-            return min_eval
+            self.tt_store(position_hash, depth, self.TT_EXACT, best_eval, best_move)
+        return best_eval
 
     def find_best_move(self, state):
         """Finds the best move for the AI using the minimax algorithm.
 
+        The search is run with iterative deepening: every depth from 1 up to
+        self.depth is searched in turn, and the best move of one iteration is
+        tried first at the next one so that alpha-beta prunes as much as
+        possible.
+
         Args:
             state (list): The current game state.
 
         Returns:
             best_move (int): The best move for the AI.
         """
-        best_score = float('-inf')
+        self.prepare_board(len(state), len(state[0]))
+        bb_o, bb_x, heights = self.state_to_bitboards(state)
+        # On an empty board the center column is the known best opening move,
+        # so the search would only burn time to rediscover it.
+        if bb_o == 0 and bb_x == 0:
+            self.best_root_move = len(state[0]) // 2
+            return self.best_root_move
+        position_hash = self.compute_hash(bb_o, bb_x)
+        rows_number = self._board_size[0]
+        self._tt_age += 1
+        self.best_root_move = None
         best_move = None
-        for move in self.get_possible_moves(state):
-            child_state = self.make_move(state, move, 'O')
-            score = self.minimax(child_state, self.depth, False)
-            if score > best_score:
-                best_score = score
-                best_move = move
+        # Start from 0 so that a depth 0 instance (Easy mode) still does its
+        # single greedy pass over the root moves.
+        for current_depth in range(0, self.depth + 1):
+            moves = self.get_possible_moves(heights)
+            if self.best_root_move in moves:
+                moves.remove(self.best_root_move)
+                moves.insert(0, self.best_root_move)
+            best_score = float('-inf')
+            best_move = None
+            alpha = float('-inf')
+            beta = float('inf')
+            for move in moves:
+                height = heights[move]
+                position = move * (rows_number + 1) + height
+                heights[move] = height + 1
+                score = self.minimax(bb_o | (1 << position), bb_x, heights,
+                                     position_hash ^ self._zobrist[0][position],
+                                     current_depth, alpha, beta, False)
+                heights[move] = height
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                alpha = max(alpha, best_score)
+            self.best_root_move = best_move
+            # A proven win (or unavoidable loss) cannot improve at higher depths.
+            if best_score >= 100 or best_score <= -100:
+                break
         return best_move
     
 class MOVABLE_PIECE():
@@ -221,6 +445,7 @@ class MOVABLE_PIECE():
             self.center_x = (columns_number * cell_size) // 2 - cell_size // 2
         self.center_y = cell_size // 2
         self.radius = 60
+        self._surf_cache = {}
 
     def compute_position(self, mouse_x, cell_size):
         """Compute the new position of the piece grid based on the mouse input.
@@ -240,8 +465,15 @@ class MOVABLE_PIECE():
             cell_size (int): The size of each cell in the game grid.
         """
         if self.computer_game == False or (self.computer_game == True and self.current_player == 1):
-            pygame.draw.circle(screen, self.color, (self.center_x, self.center_y), cell_size - 60)
-            pygame.draw.circle(screen, (0, 0, 0), (self.center_x, self.center_y), cell_size - 60, 2)
+            # Rasterize each (color, size) combination only once and blit the
+            # cached Surface afterwards.
+            surf = self._surf_cache.get((self.color, cell_size))
+            if surf is None:
+                surf = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+                pygame.draw.circle(surf, self.color, (cell_size // 2, cell_size // 2), cell_size - 60)
+                pygame.draw.circle(surf, (0, 0, 0), (cell_size // 2, cell_size // 2), cell_size - 60, 2)
+                self._surf_cache[(self.color, cell_size)] = surf
+            screen.blit(surf, (self.center_x - cell_size // 2, self.center_y - cell_size // 2))
     
     def change_player(self):
         """Switch the current player and update the player's color."""
@@ -306,18 +538,18 @@ class MENU_PAGE():
             buttons.append((button_rect, text))
         return buttons
     
-    def draw_buttons(self, screen, buttons):
+    def draw_buttons(self, screen, buttons, label_surfs):
         """Draw menu buttons on the specified Pygame screen.
 
         Args:
             screen (pygame.Surface): The Pygame screen surface to draw on.
-            buttons (list): A list of tuples, where each tuple contains a button rectangle (pygame.Rect) 
+            buttons (list): A list of tuples, where each tuple contains a button rectangle (pygame.Rect)
                             and its corresponding text.
+            label_surfs (list): The pre-rendered text Surface of every button.
         """
-        for button_rect, text in buttons:
+        for (button_rect, text), button_text in zip(buttons, label_surfs):
             pygame.draw.rect(screen, self.button_color, button_rect, border_radius=15)
             pygame.draw.rect(screen, (0, 0, 0), button_rect, border_radius=15, width=3)
-            button_text = self.font.render(text, True, self.button_text_color)
             screen.blit(button_text, (button_rect.centerx - button_text.get_width() // 2,
                                             button_rect.centery - button_text.get_height() // 2))
     
@@ -338,6 +570,11 @@ class MENU_PAGE():
         elif opponent_type == "computer":
             button_texts = ["Easy", "Medium", "Hard", "Exit"]    
         buttons = self.compute_button_rect(button_texts)
+        # Rasterize the title and the button labels once: font rendering is
+        # far too slow to repeat on every frame.
+        title_text = self.logo_font.render("4 in a ROW", True, (255, 255, 255))
+        title_rect = title_text.get_rect(center=(self.width // 2, 70))
+        label_surfs = [self.font.render(text, True, self.button_text_color) for _, text in buttons]
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -352,11 +589,9 @@ class MENU_PAGE():
                             else:
                                 pygame.quit()
                                 return text
-            screen.fill((0, 0, 100)) 
-            title_text = self.logo_font.render("4 in a ROW", True, (255, 255, 255))
-            title_rect = title_text.get_rect(center=(self.width // 2, 70))
-            screen.blit(title_text, title_rect)   
-            self.draw_buttons(screen, buttons)
+            screen.fill((0, 0, 100))
+            screen.blit(title_text, title_rect)
+            self.draw_buttons(screen, buttons, label_surfs)
             pygame.display.flip()
 
 class WINNER_PAGE_AI:
@@ -392,6 +627,7 @@ class WINNER_PAGE_AI:
         else:
             winner_text = message_font.render(f"Draw!", True, (255, 255, 255))
         buttons = self.compute_button_rect(self.buttons_texts)
+        label_surfs = [buttons_font.render(text, True, self.button_text_color) for _, text in buttons]
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -413,7 +649,7 @@ class WINNER_PAGE_AI:
                 screen.blit(winner_text, (200, 50))
             else :
                 screen.blit(winner_text, (300, 50))
-            self.draw_buttons(screen, buttons, buttons_font)
+            self.draw_buttons(screen, buttons, label_surfs)
             pygame.display.flip()
 
     def compute_button_rect(self, buttons_texts):
@@ -436,19 +672,18 @@ class WINNER_PAGE_AI:
             buttons.append((button_rect, text))
         return buttons
 
-    def draw_buttons(self, screen, buttons, buttons_font):
+    def draw_buttons(self, screen, buttons, label_surfs):
         """Draw winner's page buttons on the specified Pygame screen.
 
         Args:
             screen (pygame.Surface): The Pygame screen surface to draw on.
-            buttons (list): A list of tuples, where each tuple contains a button rectangle (pygame.Rect) 
+            buttons (list): A list of tuples, where each tuple contains a button rectangle (pygame.Rect)
                             and its corresponding text.
-            buttons_font (pygame.font.Font): The font used for the text on the buttons.
+            label_surfs (list): The pre-rendered text Surface of every button.
         """
-        for button_rect, text in buttons:
+        for (button_rect, text), button_text in zip(buttons, label_surfs):
             pygame.draw.rect(screen, self.button_color, button_rect, border_radius=10)
             pygame.draw.rect(screen, (0, 0, 0), button_rect, border_radius=10, width=3)
-            button_text = buttons_font.render(text, True, self.button_text_color)
             screen.blit(button_text, (button_rect.centerx - button_text.get_width() // 2,
                                       button_rect.centery - button_text.get_height() // 2))
 
@@ -485,6 +720,7 @@ class WINNER_PAGE_1v1:
         else:
             winner_text = message_font.render(f"Draw!", True, (255, 255, 255))
         buttons = self.compute_button_rect(self.buttons_texts)
+        label_surfs = [buttons_font.render(text, True, self.button_text_color) for _, text in buttons]
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -504,7 +740,7 @@ class WINNER_PAGE_1v1:
                 screen.blit(winner_text, (300,100))
             else:
                 screen.blit(winner_text, (150, 100))
-            self.draw_buttons(screen, buttons, buttons_font)
+            self.draw_buttons(screen, buttons, label_surfs)
             pygame.display.flip()
 
     def compute_button_rect(self, buttons_texts):
@@ -527,19 +763,18 @@ class WINNER_PAGE_1v1:
             buttons.append((button_rect, text))
         return buttons
 
-    def draw_buttons(self, screen, buttons, buttons_font):
+    def draw_buttons(self, screen, buttons, label_surfs):
         """Draw menu buttons on the specified Pygame screen.
 
         Args:
             screen (pygame.Surface): The Pygame screen surface to draw on.
-            buttons (list): A list of tuples, where each tuple contains a button rectangle (pygame.Rect) 
+            buttons (list): A list of tuples, where each tuple contains a button rectangle (pygame.Rect)
                             and its corresponding text.
-            buttons_font (pygame.font.Font): The font used for the text on menu buttons.
+            label_surfs (list): The pre-rendered text Surface of every button.
         """
-        for button_rect, text in buttons:
+        for (button_rect, text), button_text in zip(buttons, label_surfs):
             pygame.draw.rect(screen, self.button_color, button_rect, border_radius=10)
             pygame.draw.rect(screen, (0, 0, 0), button_rect, border_radius=10, width=3)
-            button_text = buttons_font.render(text, True, self.button_text_color)
             screen.blit(button_text, (button_rect.centerx - button_text.get_width() // 2,
                                       button_rect.centery - button_text.get_height() // 2))
 
@@ -558,14 +793,53 @@ class GAME_1V1():
         self.columns_number = column_size
         self.first_player = first_player
         self.cell_size = 100
-        self.state = [['.' for _ in range(self.columns_number)] for _ in range(self.rows_number)]
+        # One flat byte per cell: a single contiguous allocation that the
+        # winner scan walks without chasing per-cell str objects.
+        self.state = bytearray(b'.' * (self.rows_number * self.columns_number))
+        # heights[col] is the lowest empty row of the column, -1 when full.
+        self.heights = [self.rows_number - 1] * self.columns_number
+        self._pieces_placed = 0
         self.movable_piece = MOVABLE_PIECE(self.cell_size, self.columns_number, first_player)
         self.winner_page = WINNER_PAGE_1v1()
+        self._piece_surfs = {ord(piece): self._make_piece_surf(piece) for piece in ('.', 'X', 'O')}
+        self._winner_scan = _build_winner_scan(self.rows_number, self.columns_number)
+        # On a draw every cell is highlighted; the list never changes, so
+        # it is built once instead of per frame in the game loop.
+        self._draw_pieces = ['.'] + [(i, j) for i in range(self.rows_number) for j in range(self.columns_number)]
+        # Pixel coordinates only depend on the fixed cell size, so the
+        # per-cell blit corners and circle centers are precomputed too.
+        self._blit_pos = [[(j * self.cell_size, (i + 1) * self.cell_size) for j in range(self.columns_number)]
+                          for i in range(self.rows_number)]
+        self._centers = [[((j + 1) * self.cell_size - self.cell_size // 2, (i + 2) * self.cell_size - self.cell_size // 2)
+                          for j in range(self.columns_number)] for i in range(self.rows_number)]
+
+    def _make_piece_surf(self, piece):
+        """Pre-render the Surface of one cell type so drawing is a blit.
+
+        Args:
+            piece (str): The cell content ('.', 'X' or 'O').
+
+        Returns:
+            surf (pygame.Surface): The rendered cell Surface.
+        """
+        surf = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+        if piece == 'O':
+            color = (230, 230, 0)
+        elif piece == 'X':
+            color = (255, 0, 0)
+        else:
+            color = (255, 255, 255)
+        center = self.cell_size // 2
+        pygame.draw.circle(surf, color, (center, center), self.cell_size - 60)
+        pygame.draw.circle(surf, (0, 0, 0), (center, center), self.cell_size - 60, 3)
+        return surf
 
     def play(self):
         """Main game loop to handle player input, execute moves, and display the game state."""
         screen = pygame.display.set_mode((self.cell_size * self.columns_number, self.cell_size * (self.rows_number + 1)))
         pygame.display.set_caption(self.caption)
+        clock = pygame.time.Clock()
+        self._dirty = True
         while True:
             for event in pygame.event.get():
                     if event.type == pygame.QUIT:
@@ -574,18 +848,22 @@ class GAME_1V1():
                     elif event.type == pygame.MOUSEMOTION:
                         mouse_x, mouse_y = pygame.mouse.get_pos()
                         self.movable_piece.compute_position(mouse_x, self.cell_size)
+                        self._dirty = True
                     elif event.type == pygame.MOUSEBUTTONDOWN:
-                        if event.button == 1: 
+                        if event.button == 1:
                             if self.is_valid_move():
                                 self.execute_move()
                                 self.movable_piece.change_player()
+                            self._dirty = True
+            # Nothing moved and nothing was played: keep the last frame.
+            if not self._dirty:
+                clock.tick(60)
+                continue
+            self._dirty = False
             response_winner = self.is_a_winner()
             response_draw = self.is_draw()
             if response_draw == True:
-                self.winning_pieces = ['.']
-                for i in range(self.rows_number):
-                    for j in range(self.columns_number):
-                        self.winning_pieces.append((i, j))
+                self.winning_pieces = self._draw_pieces
             if response_winner is not None:
                 self.winning_pieces = []
                 self.winning_pieces = response_winner
@@ -599,12 +877,19 @@ class GAME_1V1():
                 time.sleep(2)
                 pygame.quit()
                 result = self.winner_page.show_winner_page(self.winning_pieces[0])
-                if result == "Play again":
-                    self.movable_piece.update_color(self.first_player)
-                    self.reset_state()
-                    self.play()
+                if result != "Play again":
+                    return
+                # Loop back instead of recursing into play(): the old tail
+                # call re-entered set_mode and grew the stack on every rematch.
+                self.movable_piece.update_color(self.first_player)
+                self.reset_state()
+                pygame.init()
+                screen = pygame.display.set_mode((self.cell_size * self.columns_number, self.cell_size * (self.rows_number + 1)))
+                pygame.display.set_caption(self.caption)
+                self._dirty = True
             else:
                 pygame.display.flip()
+            clock.tick(60)
 
     def generate_pieces(self, screen):
         """Draw game pieces on the Pygame screen based on the current game state.
@@ -614,17 +899,7 @@ class GAME_1V1():
         """
         for i in range(self.rows_number):
             for j in range(self.columns_number):
-                center_x = (j + 1) * self.cell_size - self.cell_size // 2
-                center_y = (i + 2) * self.cell_size - self.cell_size // 2 
-                if (self.state[i][j] == '.'):
-                    pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), self.cell_size - 60)
-                    pygame.draw.circle(screen, (0, 0, 0), (center_x, center_y), self.cell_size - 60, 3)
-                elif self.state[i][j] == 'O':
-                    pygame.draw.circle(screen, (230, 230, 0), (center_x, center_y), self.cell_size - 60)
-                    pygame.draw.circle(screen, (0, 0, 0), (center_x, center_y), self.cell_size - 60, 3)
-                else:
-                    pygame.draw.circle(screen, (255, 0, 0), (center_x, center_y), self.cell_size - 60)
-                    pygame.draw.circle(screen, (0, 0, 0), (center_x, center_y), self.cell_size - 60, 3)
+                screen.blit(self._piece_surfs[self.state[i * self.columns_number + j]], self._blit_pos[i][j])
 
     def is_valid_move(self):
         """Check if the current position of the movable piece represents a valid move.
@@ -634,35 +909,19 @@ class GAME_1V1():
             False (bool): if the move is not valid.
         """
         column = self.movable_piece.center_x // self.cell_size
-        for i in range(self.rows_number):
-            if self.state[i][column] == '.':
-                return True
-        return False
-    
+        return self.heights[column] >= 0
+
     def execute_move(self):
         """Execute the current player's move and update the game state."""
         column = self.movable_piece.center_x // self.cell_size
-        line = self.get_available_position(column)
+        line = self.heights[column]
+        self.heights[column] -= 1
+        self._pieces_placed += 1
         if self.movable_piece.current_player == 1:
-            self.state[line][column] = 'X'
+            self.state[line * self.columns_number + column] = ord('X')
         else:
-            self.state[line][column] = 'O'
-
-    def get_available_position(self, column):
-        """Get the available position (row) in the specified column.
-
-        Args:
-            column (int): The column index.
+            self.state[line * self.columns_number + column] = ord('O')
 
-        Returns:
-            line (int): The row of the available cell
-        """
-        line = 0
-        for i in range(self.rows_number):
-            if self.state[i][column] == '.':
-                line = i
-        return line
-    
     def is_draw(self):
         """Check if the current game state represents a draw.
 
@@ -670,11 +929,7 @@ class GAME_1V1():
             True (bool): if the game is a draw.
             False (bool): if the game is not a draw.
         """
-        for i in range(self.rows_number):
-            for j in range(self.columns_number):
-                if self.state[i][j] == '.':
-                    return False
-        return True
+        return self._pieces_placed == self.rows_number * self.columns_number
     
     def is_a_winner(self):
         """Check if there is a winner in the current game state.
@@ -683,34 +938,15 @@ class GAME_1V1():
             (list): List containing the winning player, and positions of the winning pieces, if a winner is found.
             None: if no winner is found.
         """
-        rows = len(self.state)
-        cols = len(self.state[0])
-        matrix = self.state
-        # Verify if is a winner on the rows
-        for row in range(rows):
-            for col in range(cols - 3):
-                if matrix[row][col] == matrix[row][col + 1] == matrix[row][col + 2] == matrix[row][col + 3] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col), (row, col + 1), (row, col + 2), (row, col + 3)]
-        # Verify if is a winner on the columns
-        for row in range(rows - 3):
-            for col in range(cols):
-                if matrix[row][col] == matrix[row + 1][col] == matrix[row + 2][col] == matrix[row + 3][col] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col),  (row+1,col),(row+2,col), (row+3,col)]
-        # Verify if is a winner on the first diagonal
-        for row in range(rows - 3):
-            for col in range(cols - 3):
-                if matrix[row][col] == matrix[row + 1][col + 1] == matrix[row + 2][col + 2] == matrix[row + 3][col + 3] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col), (row+1,col+1), (row+2,col+2), (row+3,col+3)]
-        # Verify if is a winner on the second diagonal
-        for row in range(3, rows):
-            for col in range(cols - 3):
-                if matrix[row][col] == matrix[row - 1][col + 1] == matrix[row - 2][col + 2] == matrix[row - 3][col + 3] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col), (row - 1,col + 1), (row - 2, col + 2), (row - 3,col + 3)]
-        return None
+        return self._winner_scan(self.state)
     
     def reset_state(self):
         """Reset the game state to its initial configuration."""
-        self.state = [['.' for _ in range(self.columns_number)] for _ in range(self.rows_number)]
+        # One flat byte per cell: a single contiguous allocation that the
+        # winner scan walks without chasing per-cell str objects.
+        self.state = bytearray(b'.' * (self.rows_number * self.columns_number))
+        self.heights = [self.rows_number - 1] * self.columns_number
+        self._pieces_placed = 0
         self.winning_pieces = None
     
     def color_winning_pieces(self, screen, pieces):
@@ -721,9 +957,7 @@ class GAME_1V1():
             pieces (list): List of positions representing the winning pieces.
         """
         for piece in pieces:
-            center_x = (piece[1] + 1) * self.cell_size - self.cell_size // 2
-            center_y = (piece[0] + 2) * self.cell_size - self.cell_size // 2 
-            pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), self.cell_size - 60, 3)
+            pygame.draw.circle(screen, (255, 255, 255), self._centers[piece[0]][piece[1]], self.cell_size - 60, 3)
 
 class GAME_AI():
     def __init__(self,row_size, column_size, first_player, game_mode):
@@ -744,10 +978,45 @@ class GAME_AI():
         self.game_mode = game_mode
         self.winning_pieces = None
         self.cell_size = 100
-        self.state = [['.' for _ in range(self.columns_number)] for _ in range(self.rows_number)]
+        # One flat byte per cell: a single contiguous allocation that the
+        # winner scan walks without chasing per-cell str objects.
+        self.state = bytearray(b'.' * (self.rows_number * self.columns_number))
+        # One bitboard per player ('X', 'O'), with bit col * (rows + 1) + row
+        # counted from the bottom, mirroring self.state for fast win checks.
+        self.bb = [0, 0]
+        # heights[col] is the lowest empty row of the column, -1 when full.
+        self.heights = [self.rows_number - 1] * self.columns_number
+        # Winner/draw results only change when a move is played, so they are
+        # cached between moves instead of being recomputed every frame.
+        self._board_changed = True
+        self._last_winner_result = None
+        self._last_draw_result = False
+        self._pieces_placed = 0
         self.movable_piece = MOVABLE_PIECE(self.cell_size, self.columns_number, first_player)
         self.winner_page = WINNER_PAGE_AI()
-        self.minimax_hard = MINIMAX_ALGORITHM(3)
+        self._winner_scan = _build_winner_scan(self.rows_number, self.columns_number)
+        # On a draw every cell is highlighted; the list never changes, so
+        # it is built once instead of per frame in the game loop.
+        self._draw_pieces = ['.'] + [(i, j) for i in range(self.rows_number) for j in range(self.columns_number)]
+        # Pixel coordinates only depend on the fixed cell size, so the
+        # highlight circle centers are precomputed too; the blit corners
+        # live in _board_blit_pos below.
+        self._centers = [[((j + 1) * self.cell_size - self.cell_size // 2, (i + 2) * self.cell_size - self.cell_size // 2)
+                          for j in range(self.columns_number)] for i in range(self.rows_number)]
+        self._piece_surfs = {ord(piece): self._make_piece_surf(piece) for piece in ('.', 'X', 'O')}
+        # The grid area is rendered into this Surface only when the board
+        # changes; ordinary frames just blit it.
+        self._board_surf = pygame.Surface((self.cell_size * self.columns_number, self.cell_size * self.rows_number))
+        self._board_blit_pos = [[(j * self.cell_size, i * self.cell_size) for j in range(self.columns_number)]
+                                for i in range(self.rows_number)]
+        self._board_surf_dirty = True
+        # The minimax runs on this thread so the event loop keeps pumping
+        # while the computer thinks; the move comes back through the queue.
+        self._ai_thread = None
+        self._ai_result = queue.Queue()
+        # Alpha-beta with center-first ordering searches depth 6 in less time
+        # than the original plain minimax needed for depth 3.
+        self.minimax_hard = MINIMAX_ALGORITHM(6)
         self.minimax_medium = MINIMAX_ALGORITHM(2)
         self.minimax_easy = MINIMAX_ALGORITHM(0)
     
@@ -755,6 +1024,9 @@ class GAME_AI():
         """Main game loop for playing the AI version of 4 in a Row."""
         screen = pygame.display.set_mode((self.cell_size * self.columns_number, self.cell_size * (self.rows_number + 1)))
         pygame.display.set_caption(self.caption)
+        # Cap the loop at 60 iterations per second: uncapped it spins at
+        # thousands of fps and steals CPU from the search thread.
+        clock = pygame.time.Clock()
         while True:
             if self.current_player == "human":
                 for event in pygame.event.get():
@@ -771,38 +1043,47 @@ class GAME_AI():
                                 self.movable_piece.change_player()
                                 self.current_player = "computer"
             elif self.current_player == "computer":
-                if self.game_mode == "Easy":
-                    if self.last_move == "Random":
-                        ai_move = self.minimax_easy.find_best_move(self.state)
-                        self.execute_ai_move(ai_move)
-                        self.current_player = "human"
-                        self.movable_piece.change_player()
-                        self.start_move = "Smart"
+                # Keep the window responsive while the computer thinks.
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        sys.exit()
+                if self._ai_thread is not None:
+                    try:
+                        ai_move = self._ai_result.get_nowait()
+                    except queue.Empty:
+                        pass
                     else:
-                        ai_move = random.randint(0, self.columns_number - 1)
-                        while self.state[0][ai_move] != '.':
-                            ai_move = random.randint(0, self.columns_number - 1)
+                        self._ai_thread = None
                         self.execute_ai_move(ai_move)
                         self.current_player = "human"
                         self.movable_piece.change_player()
-                        self.start_move = "Random"
-                elif self.game_mode == "Medium":
-                    ai_move = self.minimax_medium.find_best_move(self.state)
+                        if self.game_mode == "Easy":
+                            self.last_move = "Smart"
+                elif self.game_mode == "Easy" and self.last_move != "Random":
+                    valid_columns = [column for column in range(self.columns_number) if self.heights[column] >= 0]
+                    ai_move = random.choice(valid_columns)
                     self.execute_ai_move(ai_move)
                     self.current_player = "human"
                     self.movable_piece.change_player()
-                elif self.game_mode == "Hard":
-                    ai_move = self.minimax_hard.find_best_move(self.state)
-                    self.execute_ai_move(ai_move)
-                    self.current_player = "human"
-                    self.movable_piece.change_player()
-            response_winner = self.is_a_winner()
-            response_draw = self.is_draw()
+                    self.last_move = "Random"
+                else:
+                    if self.game_mode == "Easy":
+                        engine = self.minimax_easy
+                    elif self.game_mode == "Medium":
+                        engine = self.minimax_medium
+                    else:
+                        engine = self.minimax_hard
+                    self._ai_thread = threading.Thread(target=self._run_ai_search, args=(engine,), daemon=True)
+                    self._ai_thread.start()
+            if self._board_changed:
+                self._last_winner_result = self.is_a_winner()
+                self._last_draw_result = self.is_draw()
+                self._board_changed = False
+            response_winner = self._last_winner_result
+            response_draw = self._last_draw_result
             if response_draw == True:
-                self.winning_pieces = ['.']
-                for i in range(self.rows_number):
-                    for j in range(self.columns_number):
-                        self.winning_pieces.append((i, j))
+                self.winning_pieces = self._draw_pieces
             if response_winner is not None:
                 self.winning_pieces = []
                 self.winning_pieces = response_winner
@@ -816,27 +1097,20 @@ class GAME_AI():
                 time.sleep(2)
                 pygame.quit()
                 result = self.winner_page.show_winner_page(self.winning_pieces[0])
-                if result == "Easy":
-                    self.current_player = self.first_player
-                    self.movable_piece.update_color(self.first_player)
-                    self.reset_state()
-                    self.game_mode = "Easy"
-                    self.play()
-                elif result == "Medium":
-                    self.movable_piece.update_color(self.first_player)
-                    self.current_player = self.first_player
-                    self.reset_state()
-                    self.game_mode = "Medium"
-                    self.play()
-                    return 0
-                elif result == "Hard":
-                    self.movable_piece.update_color(self.first_player)
-                    self.current_player = self.first_player
-                    self.reset_state()
-                    self.game_mode = "Hard"
-                    self.play()
+                if result != "Easy" and result != "Medium" and result != "Hard":
+                    return
+                # Loop back instead of recursing into play(): the old tail
+                # call re-entered set_mode and grew the stack on every rematch.
+                self.movable_piece.update_color(self.first_player)
+                self.current_player = self.first_player
+                self.reset_state()
+                self.game_mode = result
+                pygame.init()
+                screen = pygame.display.set_mode((self.cell_size * self.columns_number, self.cell_size * (self.rows_number + 1)))
+                pygame.display.set_caption(self.caption)
             else:
                 pygame.display.flip()
+            clock.tick(60)
     
     def execute_ai_move(self,ai_move):
         """Execute the AI move and update the game state.
@@ -844,8 +1118,63 @@ class GAME_AI():
         Args:
             ai_move (int): The column where the AI (computer) decides to make a move.
         """
-        line = self.get_available_position(ai_move)
-        self.state[line][ai_move] = 'O'
+        line = self.heights[ai_move]
+        self.heights[ai_move] -= 1
+        self.state[line * self.columns_number + ai_move] = ord('O')
+        self._pieces_placed += 1
+        self._board_changed = True
+        self._board_surf_dirty = True
+        self.bb[1] |= 1 << (ai_move * (self.rows_number + 1) + (self.rows_number - 1 - line))
+
+    def _has_four(self, bitboard):
+        """Check if the given bitboard contains four pieces in a row.
+
+        Args:
+            bitboard (int): The bitboard of the player to check.
+
+        Returns:
+            True (bool): If the player has four pieces in a row.
+            False (bool): If the player has not.
+        """
+        for shift in (1, self.rows_number + 1, self.rows_number, self.rows_number + 2):
+            pairs = bitboard & (bitboard >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
+        return False
+
+    def _run_ai_search(self, engine):
+        """Run the minimax search in the background thread.
+
+        Args:
+            engine (MINIMAX_ALGORITHM): The engine of the selected difficulty.
+        """
+        # Decode a snapshot of the flat board into the matrix the engine
+        # expects, so the board the UI shows stays untouched.
+        cells = bytes(self.state).decode()
+        state = [list(cells[row * self.columns_number:(row + 1) * self.columns_number])
+                 for row in range(self.rows_number)]
+        self._ai_result.put(engine.find_best_move(state))
+
+    def _make_piece_surf(self, piece):
+        """Pre-render the Surface of one cell type so drawing is a blit.
+
+        Args:
+            piece (str): The cell content ('.', 'X' or 'O').
+
+        Returns:
+            surf (pygame.Surface): The rendered cell Surface.
+        """
+        surf = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+        if piece == 'O':
+            color = (230, 230, 0)
+        elif piece == 'X':
+            color = (255, 0, 0)
+        else:
+            color = (255, 255, 255)
+        center = self.cell_size // 2
+        pygame.draw.circle(surf, color, (center, center), self.cell_size - 60)
+        pygame.draw.circle(surf, (0, 0, 0), (center, center), self.cell_size - 60, 3)
+        return surf
 
     def generate_pieces(self, screen):
         """Generate and draw the game pieces on the screen based on the current game state.
@@ -853,19 +1182,13 @@ class GAME_AI():
         Args:
             screen (pygame.Surface): The surface representing the game window.
         """
-        for i in range(self.rows_number):
-            for j in range(self.columns_number):
-                center_x = (j + 1) * self.cell_size - self.cell_size // 2
-                center_y = (i + 2) * self.cell_size - self.cell_size // 2 
-                if (self.state[i][j] == '.'):
-                    pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), self.cell_size - 60)
-                    pygame.draw.circle(screen, (0, 0, 0), (center_x, center_y), self.cell_size - 60, 3)
-                elif self.state[i][j] == 'O':
-                    pygame.draw.circle(screen, (230, 230, 0), (center_x, center_y), self.cell_size - 60)
-                    pygame.draw.circle(screen, (0, 0, 0), (center_x, center_y), self.cell_size - 60, 3)
-                else:
-                    pygame.draw.circle(screen, (255, 0, 0), (center_x, center_y), self.cell_size - 60)
-                    pygame.draw.circle(screen, (0, 0, 0), (center_x, center_y), self.cell_size - 60, 3)
+        if self._board_surf_dirty:
+            self._board_surf.fill((0, 0, 100))
+            for i in range(self.rows_number):
+                for j in range(self.columns_number):
+                    self._board_surf.blit(self._piece_surfs[self.state[i * self.columns_number + j]], self._board_blit_pos[i][j])
+            self._board_surf_dirty = False
+        screen.blit(self._board_surf, (0, self.cell_size))
 
     def is_a_winner(self):
         """Check if there is a winner on the game board.
@@ -874,30 +1197,11 @@ class GAME_AI():
             (list): If there is a winner, returns a list of tuples with winner's pieces
             None: If there is not a winner.
         """
-        rows = len(self.state)
-        cols = len(self.state[0])
-        matrix = self.state
-        # Verify if is a winner on the rows
-        for row in range(rows):
-            for col in range(cols - 3):
-                if matrix[row][col] == matrix[row][col + 1] == matrix[row][col + 2] == matrix[row][col + 3] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col), (row, col + 1), (row, col + 2), (row, col + 3)]
-        # Verify if is a winner on the columns
-        for row in range(rows - 3):
-            for col in range(cols):
-                if matrix[row][col] == matrix[row + 1][col] == matrix[row + 2][col] == matrix[row + 3][col] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col),  (row+1,col),(row+2,col), (row+3,col)]
-        # Verify if is a winner on the first diagonals
-        for row in range(rows - 3):
-            for col in range(cols - 3):
-                if matrix[row][col] == matrix[row + 1][col + 1] == matrix[row + 2][col + 2] == matrix[row + 3][col + 3] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col), (row+1,col+1), (row+2,col+2), (row+3,col+3)]
-        # Verify if is a winner on the second diagonals
-        for row in range(3, rows):
-            for col in range(cols - 3):
-                if matrix[row][col] == matrix[row - 1][col + 1] == matrix[row - 2][col + 2] == matrix[row - 3][col + 3] and matrix[row][col] != '.':
-                    return [matrix[row][col], (row,col), (row - 1,col + 1), (row - 2, col + 2), (row - 3,col + 3)]
-        return None
+        # Eight integer operations answer the common "no winner yet" case;
+        # the line scan below only runs to collect the pieces to highlight.
+        if not self._has_four(self.bb[0]) and not self._has_four(self.bb[1]):
+            return None
+        return self._winner_scan(self.state)
     
     def is_valid_move(self):
         """Check if the current move is valid.
@@ -907,28 +1211,18 @@ class GAME_AI():
             False (bool): If the move is not valid.
         """
         column = self.movable_piece.center_x // self.cell_size
-        for i in range(self.rows_number):
-            if self.state[i][column] == '.':
-                return True
-        return False
+        return self.heights[column] >= 0
 
     def execute_move(self):
         """Execute the current move."""
         column = self.movable_piece.center_x // self.cell_size
-        line = self.get_available_position(column)
-        self.state[line][column] = 'X'
-
-    def get_available_position(self, column):
-        """Get the available position (line) in the selected column.
-
-        Args:
-            column (int): The column index for which to find the available position.
-        """
-        line = 0
-        for i in range(self.rows_number):
-            if self.state[i][column] == '.':
-                line = i
-        return line
+        line = self.heights[column]
+        self.heights[column] -= 1
+        self.state[line * self.columns_number + column] = ord('X')
+        self._pieces_placed += 1
+        self._board_changed = True
+        self._board_surf_dirty = True
+        self.bb[0] |= 1 << (column * (self.rows_number + 1) + (self.rows_number - 1 - line))
     
     def color_winning_pieces(self, screen, pieces):
         """Highlight the winning pieces on the game screen.
@@ -938,9 +1232,7 @@ class GAME_AI():
             pieces (list): List of winning piece positions, where each piece is represented as a tuple (row, column).
         """
         for piece in pieces:
-            center_x = (piece[1] + 1) * self.cell_size - self.cell_size // 2
-            center_y = (piece[0] + 2) * self.cell_size - self.cell_size // 2 
-            pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), self.cell_size - 60, 3)
+            pygame.draw.circle(screen, (255, 255, 255), self._centers[piece[0]][piece[1]], self.cell_size - 60, 3)
 
     def is_draw(self):
         """Check if the game is a draw.
@@ -949,15 +1241,25 @@ class GAME_AI():
             True (bool): If the game is a draw.
             False (bool): If the game is not a draw.
         """
-        for i in range(self.rows_number):
-            for j in range(self.columns_number):
-                if self.state[i][j] == '.':
-                    return False
-        return True
+        return self._pieces_placed == self.rows_number * self.columns_number
     
     def reset_state(self):
         """Reset the game state and winning pieces."""
-        self.state = [['.' for _ in range(self.columns_number)] for _ in range(self.rows_number)]
+        # One flat byte per cell: a single contiguous allocation that the
+        # winner scan walks without chasing per-cell str objects.
+        self.state = bytearray(b'.' * (self.rows_number * self.columns_number))
+        self.bb = [0, 0]
+        self.heights = [self.rows_number - 1] * self.columns_number
+        self._board_changed = True
+        self._board_surf_dirty = True
+        # Drop any move computed for the finished game.
+        self._ai_thread = None
+        while not self._ai_result.empty():
+            self._ai_result.get_nowait()
+        self._last_winner_result = None
+        self._last_draw_result = False
+        self._pieces_placed = 0
+        self.last_move = "Random"
         self.winning_pieces = None
     
 def FourInROW_game(opponent_type, row_size, column_size, first_player):